@@ -144,7 +144,6 @@ print("\n--- Benchmark Complete ---")
 
 # --- Display Results in a Clean Table ---
 df = pd.DataFrame(results)
-df = df.round(6) # Round to 6 decimal places for these fast operations
 
 
 # --- SAVE TO FILE (CSV) ---
@@ -158,11 +157,12 @@ os.makedirs(results_folder, exist_ok=True)
 full_output_path = os.path.join(results_folder, output_filename_csv)
 
 # 3. Save the file to that specific path
-df.to_csv(full_output_path, index=False)
+# (float_format rounds at write time instead of materializing df.round(6))
+df.to_csv(full_output_path, index=False, float_format='%.6f', lineterminator='\n')
 print(f"\n✅ Results successfully saved to: {full_output_path}")
 # ---------------------------
 
-print(df.to_markdown(index=False))
+print(df.to_string(index=False, float_format='{:.6f}'.format))
 
 print("\n--- Key Takeaways ---")
 print(" * ECC key generation is *orders of magnitude* faster than RSA.")
@@ -11,6 +11,9 @@ from cryptography.hazmat.backends import default_backend
 
 # --- Configuration ---
 NUM_ITERATIONS_ASYMMETRIC = 100 
+# Peak memory is measured in a separate, short pass: tracemalloc hooks every
+# allocation and would inflate the timings if it wrapped the timed code.
+MEMORY_ITERATIONS = 2
 print(f"Starting asymmetric benchmark (V3)...")
 print(f"Iterations per test: {NUM_ITERATIONS_ASYMMETRIC}\n")
 
@@ -27,6 +30,17 @@ print("Test data (32-byte hash) generated.\n")
 # This list will store our results
 asymmetric_results = []
 
+def measure_peak_memory(op, iterations=MEMORY_ITERATIONS):
+    """
+    Runs op() a few times under tracemalloc and returns the peak in bytes.
+    """
+    tracemalloc.start()
+    for _ in range(iterations):
+        op()
+    _, peak_mem = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_mem
+
 def benchmark_rsa(key_size_bits):
     """
     Benchmarks RSA for key generation, signing, and verification.
@@ -37,7 +51,6 @@ def benchmark_rsa(key_size_bits):
     print(f"Testing: RSA {key_size_bits}-bit")
     
     # --- 1. Key Generation ---
-    tracemalloc.start()
     start_time = time.perf_counter()
     
     private_key = rsa.generate_private_key(
@@ -47,13 +60,10 @@ def benchmark_rsa(key_size_bits):
     )
     
     key_gen_time = time.perf_counter() - start_time
-    _, key_gen_peak_mem = tracemalloc.get_traced_memory() # current, peak
-    tracemalloc.stop()
     
     public_key = private_key.public_key()
     
     # --- 2. Sign Test ---
-    tracemalloc.start()
     start_time = time.perf_counter()
     
     for _ in range(NUM_ITERATIONS_ASYMMETRIC):
@@ -67,11 +77,8 @@ def benchmark_rsa(key_size_bits):
         )
         
     avg_sign_time = (time.perf_counter() - start_time) / NUM_ITERATIONS_ASYMMETRIC
-    _, sign_peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
     
     # --- 3. Verify Test ---
-    tracemalloc.start()
     start_time = time.perf_counter()
     
     for _ in range(NUM_ITERATIONS_ASYMMETRIC):
@@ -86,10 +93,19 @@ def benchmark_rsa(key_size_bits):
         )
         
     avg_verify_time = (time.perf_counter() - start_time) / NUM_ITERATIONS_ASYMMETRIC
-    _, verify_peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
     
-    # --- 4. Return results as a dictionary ---
+    # --- 4. Memory Pass (not timed) ---
+    pss = padding.PSS(
+        mgf=padding.MGF1(hashes.SHA256()),
+        salt_length=padding.PSS.MAX_LENGTH
+    )
+    key_gen_peak_mem = measure_peak_memory(lambda: rsa.generate_private_key(
+        public_exponent=65537, key_size=key_size_bits, backend=default_backend()
+    ), iterations=1)
+    sign_peak_mem = measure_peak_memory(lambda: private_key.sign(data_hash, pss, hashes.SHA256()))
+    verify_peak_mem = measure_peak_memory(lambda: public_key.verify(signature, data_hash, pss, hashes.SHA256()))
+    
+    # --- 5. Return results as a dictionary ---
     return {
         "Algorithm": "RSA",
         "Key": f"{key_size_bits}-bit",
@@ -112,7 +128,6 @@ def benchmark_ecc(curve, curve_name, security_equiv):
     print(f"Testing: ECC {curve_name}")
     
     # --- 1. Key Generation ---
-    tracemalloc.start()
     start_time = time.perf_counter()
     
     private_key = ec.generate_private_key(
@@ -120,13 +135,10 @@ def benchmark_ecc(curve, curve_name, security_equiv):
     )
     
     key_gen_time = time.perf_counter() - start_time
-    _, key_gen_peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
     
     public_key = private_key.public_key()
     
     # --- 2. Sign Test ---
-    tracemalloc.start()
     start_time = time.perf_counter()
     
     for _ in range(NUM_ITERATIONS_ASYMMETRIC):
@@ -136,11 +148,8 @@ def benchmark_ecc(curve, curve_name, security_equiv):
         )
         
     avg_sign_time = (time.perf_counter() - start_time) / NUM_ITERATIONS_ASYMMETRIC
-    _, sign_peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
     
     # --- 3. Verify Test ---
-    tracemalloc.start()
     start_time = time.perf_counter()
     
     for _ in range(NUM_ITERATIONS_ASYMMETRIC):
@@ -151,10 +160,15 @@ def benchmark_ecc(curve, curve_name, security_equiv):
         )
         
     avg_verify_time = (time.perf_counter() - start_time) / NUM_ITERATIONS_ASYMMETRIC
-    _, verify_peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
 
-    # --- 4. Return results as a dictionary ---
+    # --- 4. Memory Pass (not timed) ---
+    key_gen_peak_mem = measure_peak_memory(
+        lambda: ec.generate_private_key(curve, backend=default_backend()), iterations=1
+    )
+    sign_peak_mem = measure_peak_memory(lambda: private_key.sign(data_hash, ec.ECDSA(hashes.SHA256())))
+    verify_peak_mem = measure_peak_memory(lambda: public_key.verify(signature, data_hash, ec.ECDSA(hashes.SHA256())))
+
+    # --- 5. Return results as a dictionary ---
     return {
         "Algorithm": "ECC",
         "Key": curve_name,
@@ -1,32 +1,139 @@
 # --- Benchmark Visualization Script (Fixed for macOS) ---
 
+import numpy as np
 import pandas as pd
 import matplotlib
 # CRITICAL FIX: Use the 'Agg' backend to prevent macOS window crashes
 matplotlib.use('Agg') 
+# Speed over fidelity: simplify paths, render in chunks, save at a lower DPI,
+# pin the font family so text layout never walks the font fallback list, and
+# keep text on the plain (non-LaTeX, ASCII minus) path
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+    'font.family': 'DejaVu Sans',
+    'text.usetex': False,
+    'axes.unicode_minus': False,
+    'savefig.dpi': 90,
+})
 import matplotlib.pyplot as plt
+from matplotlib import font_manager
+# Resolve the font once up front (findfont is cached for the rest of the run)
+font_manager.fontManager.findfont('DejaVu Sans')
+import io
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 # --- Setup Paths ---
 SCRIPT_DIRECTORY = os.getcwd()
 RESULTS_FOLDER = os.path.join(SCRIPT_DIRECTORY, "results")
 SYMMETRIC_CSV = os.path.join(RESULTS_FOLDER, "symmetric_benchmark_results.csv")
 ASYMMETRIC_CSV = os.path.join(RESULTS_FOLDER, "asymmetric_benchmark_results.csv")
+SYM_CHART = os.path.join(RESULTS_FOLDER, 'symmetric_encrypt_throughput.png')
+ASYM_KEYGEN_CHART = os.path.join(RESULTS_FOLDER, 'asymmetric_key_gen_time.png')
+ASYM_SIGN_VERIFY_CHART = os.path.join(RESULTS_FOLDER, 'asymmetric_sign_verify_time.png')
+ASYM_MEMORY_CHART = os.path.join(RESULTS_FOLDER, 'asymmetric_key_gen_memory.png')
 
-print("Starting visualization script...")
-if not os.path.exists(RESULTS_FOLDER):
-    print(f"Error: 'results' folder not found at {RESULTS_FOLDER}", file=sys.stderr)
-    sys.exit(1)
+# PNG writer settings: a lighter zlib level and no optimize pass. The charts
+# are mostly flat colour, so the files grow a little but save faster.
+PNG_SAVE_KWARGS = {'pil_kwargs': {'compress_level': 3, 'optimize': False}}
 
-def plot_symmetric_results(filepath):
-    """Plots the symmetric benchmark results."""
-    print(f"Plotting symmetric results from {filepath}...")
+# Row order for the symmetric chart
+DATA_SIZE_ORDER = ['1KB', '1MB', '100MB']
+# Above this many algorithm/key/mode combinations, skip the symmetric legend
+MAX_LEGEND_ENTRIES = 20
+
+# --- Column Types ---
+# Only the columns each plot uses are read, with fixed dtypes (no type
+# inference); the label columns are low-cardinality, so they are categories.
+SYM_DTYPES = {
+    'Data Size': 'category',
+    'Algorithm': 'category',
+    'Key Size': 'category',
+    'Mode': 'category',
+    'Encrypt (MB/s)': 'float32',
+}
+ASYM_DTYPES = {
+    'Key': 'category',
+    'Key Gen (s)': 'float32',
+    'Sign (s)': 'float32',
+    'Verify (s)': 'float32',
+    'Key Gen Peak (KiB)': 'float32',
+}
+
+def read_results(filepath, dtypes):
+    """
+    Reads the columns listed in `dtypes` from a results CSV, preferring the
+    Parquet copy written next to it by the benchmark scripts (columnar, exact
+    dtypes) when it is at least as new. If the file is missing one of those
+    columns (e.g. an older results format), every column is read and the
+    ones that are present are converted afterwards. A 0-byte file (left by
+    an interrupted benchmark) gives an empty frame.
+    """
+    columns = list(dtypes)
+    parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+    if (os.path.exists(parquet_path)
+            and os.path.getmtime(parquet_path) >= os.path.getmtime(filepath)):
+        try:
+            return pd.read_parquet(parquet_path, columns=columns).astype(dtypes)
+        except (ImportError, ValueError):
+            pass # No Parquet engine or a missing column, fall back to the CSV
     try:
+        return pd.read_csv(filepath, usecols=columns, dtype=dtypes,
+                           engine='c', low_memory=False)
+    except pd.errors.EmptyDataError: # Not even a header: nothing to read again
+        return pd.DataFrame({c: pd.Series(dtype=t) for c, t in dtypes.items()})
+    except ValueError: # usecols names a column the file does not have
         df = pd.read_csv(filepath)
-    except FileNotFoundError:
-        print(f"Error: Could not find {filepath}", file=sys.stderr)
-        return
+        # Still give the columns that are present their category/float dtypes
+        return df.astype({c: t for c, t in dtypes.items() if c in df.columns})
+
+def _fast_save(fig, path):
+    """
+    Encodes the figure to PNG in memory, then writes the file with raw
+    os.write calls instead of handing Pillow a Python file object.
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', **PNG_SAVE_KWARGS)
+    data = buf.getbuffer()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = 0
+        while written < len(data): # os.write may write less than asked
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+def _grouped_bars(ax, labels, series, group_width=0.8):
+    """
+    Draws one bar per (legend label, values) pair in `series` for each x
+    label, side by side, with plain Axes.bar calls at numeric x positions.
+    """
+    xs = np.arange(len(labels))
+    width = group_width / len(series)
+    for i, (name, values) in enumerate(series):
+        offset = (i - (len(series) - 1) / 2) * width
+        ax.bar(xs + offset, values, width=width, label=name)
+    ax.set_xticks(xs, labels)
+    ax.set_axisbelow(True) # Keep grid lines behind the bars
+
+# --- Cached Loaders ---
+# Each results file is parsed once per run; every chart reuses the same frame.
+@lru_cache(maxsize=None)
+def _load_sym():
+    return read_results(SYMMETRIC_CSV, SYM_DTYPES)
+
+@lru_cache(maxsize=None)
+def _load_asym():
+    return read_results(ASYMMETRIC_CSV, ASYM_DTYPES)
+
+def plot_symmetric_results(df, fig, ax):
+    """Plots the symmetric benchmark results."""
+    print(f"Plotting symmetric results from {SYMMETRIC_CSV}...", flush=True)
 
     # Pivot table logic
     try:
@@ -36,104 +143,219 @@ def plot_symmetric_results(filepath):
         else:
             pivot_cols = ['Algorithm', 'Mode']
 
-        df_pivot = df.pivot_table(index='Data Size', 
-                                  columns=pivot_cols, 
-                                  values='Encrypt (MB/s)')
-        
-        # Re-order logic
-        existing_labels = [l for l in ['1KB', '1MB', '100MB'] if l in df_pivot.index]
-        if existing_labels:
-            df_pivot = df_pivot.reindex(existing_labels)
+        # Ordered sizes, so the reshaped rows come out 1KB, 1MB, 100MB; any
+        # other sizes in the file are kept and ordered after those
+        sizes = df['Data Size'].astype(str)
+        extra_sizes = [l for l in sizes.unique() if l not in DATA_SIZE_ORDER]
+        df = df.assign(**{'Data Size': pd.Categorical(sizes,
+                                                      categories=DATA_SIZE_ORDER + extra_sizes,
+                                                      ordered=True)})
+        df = df.sort_values('Data Size')
 
+        # Rows are already unique per (Data Size, *pivot_cols), so this is a
+        # plain index reshape with no groupby/mean pass. The label columns are
+        # categories, so drop the unused category combinations unstack creates.
+        df_pivot = (df.set_index(['Data Size'] + pivot_cols)['Encrypt (MB/s)']
+                      .unstack(level=pivot_cols, fill_value=float('nan'))
+                      .dropna(axis=1, how='all'))
+        # Flatten the column MultiIndex once into plain legend labels
+        # (e.g. 'AES-256-GCM') instead of letting pandas format each tuple
+        df_pivot.columns = ['-'.join(map(str, col)) for col in df_pivot.columns]
+        # Values are read as float32; make sure the reshape (and its NaN fill)
+        # hands the bars float32 too (no copy when the dtype already matches)
+        df_pivot = df_pivot.astype(np.float32)
+        if df_pivot.empty:
+            print("  No throughput values to plot, skipping symmetric chart", flush=True)
+            return
+        
         # Plot
-        ax = df_pivot.plot(kind='bar',
-                             title='Symmetric Encrypt Throughput (Higher is Better)',
-                             figsize=(12, 7),
-                             rot=0,
-                             grid=True)
+        _grouped_bars(ax, df_pivot.index.astype(str),
+                      [(col, df_pivot[col].to_numpy()) for col in df_pivot.columns])
+        ax.set_title('Symmetric Encrypt Throughput (Higher is Better)')
+        ax.grid(True)
         ax.set_ylabel('Throughput (MB/s) - Log Scale')
         ax.set_xlabel('Data Size')
         ax.set_yscale('log')
-        ax.legend(title='Algorithm', bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.tight_layout()
+        # Laying out a legend entry per column gets slow (and unreadable)
+        # for very wide pivots, so only draw it for a reasonable count
+        if len(df_pivot.columns) <= MAX_LEGEND_ENTRIES:
+            ax.legend(title='Algorithm', bbox_to_anchor=(1.05, 1), loc='upper left')
         
-        save_path = os.path.join(RESULTS_FOLDER, 'symmetric_encrypt_throughput.png')
-        plt.savefig(save_path)
-        print(f"  -> Saved chart to: {save_path}")
-        plt.close() # Close memory to prevent leaks
+        save_path = SYM_CHART
+        _fast_save(fig, save_path)
+        print(f"  -> Saved chart to: {save_path}", flush=True)
     except Exception as e:
-        print(f"Failed to plot symmetric results: {e}")
+        print(f"Failed to plot symmetric results: {e}", flush=True)
 
-def plot_asymmetric_results(filepath):
-    """Plots the asymmetric benchmark results."""
-    print(f"Plotting asymmetric results from {filepath}...")
+def _key_colors(df):
+    """Bar colours shared by the key gen time and memory charts."""
+    return ['#3b82f6' if 'RSA' in k else '#22c55e' for k in df['Key']]
+
+def _generated_keys(df, column):
+    """
+    Returns the rows that have a key generation measurement in `column`.
+    Keys loaded from cache (--warm-keys runs) leave it empty and are left
+    out of the key gen charts rather than plotted as a generation time.
+    """
+    measured = df.dropna(subset=[column])
+    skipped = df.loc[df[column].isna(), 'Key']
+    if len(skipped):
+        print(f"  (not generated in this run, left out: {', '.join(map(str, skipped))})", flush=True)
+    return measured, len(skipped) > 0
+
+def plot_key_gen_time(df, fig, ax):
+    """Plots asymmetric key generation time."""
+    print(f"Plotting key gen time from {ASYMMETRIC_CSV}...", flush=True)
     try:
-        df = pd.read_csv(filepath)
-    except FileNotFoundError:
-        print(f"Error: Could not find {filepath}", file=sys.stderr)
-        return
+        df, has_cached = _generated_keys(df, 'Key Gen (s)')
+        ax.bar(np.arange(len(df)), df['Key Gen (s)'].to_numpy(), color=_key_colors(df),
+               tick_label=df['Key'].to_numpy())
+        ax.set_title('Asymmetric Key Generation Time (Lower is Better)')
+        ax.set_ylabel('Time (seconds)')
+        ax.set_xlabel('Key Type' + (' (cached keys not shown)' if has_cached else ''))
+        ax.tick_params(axis='x', labelrotation=15)
+        ax.grid(axis='y', alpha=0.3)
 
+        save_path = ASYM_KEYGEN_CHART
+        _fast_save(fig, save_path)
+        print(f"  -> Saved chart to: {save_path}", flush=True)
+    except Exception as e:
+        print(f"Failed to plot key gen time: {e}", flush=True)
+
+def plot_sign_verify_time(df, fig, ax):
+    """Plots asymmetric sign and verify time as grouped bars."""
+    print(f"Plotting sign/verify time from {ASYMMETRIC_CSV}...", flush=True)
     try:
-        # Plot 1: Key Gen Time
-        plt.figure() # New figure
-        # Simple bar plot
-        colors = ['#3b82f6' if 'RSA' in k else '#22c55e' for k in df['Key']]
-        plt.bar(df['Key'], df['Key Gen (s)'], color=colors)
-        plt.title('Asymmetric Key Generation Time (Lower is Better)')
-        plt.ylabel('Time (seconds)')
-        plt.xlabel('Key Type')
-        plt.xticks(rotation=15)
-        plt.grid(axis='y', alpha=0.3)
-        plt.tight_layout()
-        
-        save_path = os.path.join(RESULTS_FOLDER, 'asymmetric_key_gen_time.png')
-        plt.savefig(save_path)
-        print(f"  -> Saved chart to: {save_path}")
-        plt.close()
-
-        # Plot 2: Sign/Verify Time (Grouped Bar)
-        ax = df.plot(kind='bar', x='Key', y=['Sign (s)', 'Verify (s)'],
-                title='Asymmetric Sign & Verify Time (Lower is Better)',
-                figsize=(10, 6),
-                rot=15,
-                grid=True)
-        plt.ylabel('Time (seconds)')
-        plt.xlabel('Key Type')
-        plt.tight_layout()
-        
-        save_path = os.path.join(RESULTS_FOLDER, 'asymmetric_sign_verify_time.png')
-        plt.savefig(save_path)
-        print(f"  -> Saved chart to: {save_path}")
-        plt.close()
-        
-        # Plot 3: Memory (if column exists)
-        if 'Key Gen Peak (KiB)' in df.columns:
-            plt.figure()
-            plt.bar(df['Key'], df['Key Gen Peak (KiB)'], color=colors)
-            plt.title('Asymmetric Key Gen Peak Memory (Lower is Better)')
-            plt.ylabel('Peak Memory (KiB)')
-            plt.xlabel('Key Type')
-            plt.xticks(rotation=15)
-            plt.grid(axis='y', alpha=0.3)
-            plt.tight_layout()
-            
-            save_path = os.path.join(RESULTS_FOLDER, 'asymmetric_key_gen_memory.png')
-            plt.savefig(save_path)
-            print(f"  -> Saved chart to: {save_path}")
-            plt.close()
+        _grouped_bars(ax, df['Key'].to_numpy(),
+                      [('Sign (s)', df['Sign (s)'].to_numpy()),
+                       ('Verify (s)', df['Verify (s)'].to_numpy())])
+        ax.set_title('Asymmetric Sign & Verify Time (Lower is Better)')
+        ax.tick_params(axis='x', labelrotation=15)
+        ax.grid(True)
+        ax.legend()
+        ax.set_ylabel('Time (seconds)')
+        ax.set_xlabel('Key Type')
+
+        save_path = ASYM_SIGN_VERIFY_CHART
+        _fast_save(fig, save_path)
+        print(f"  -> Saved chart to: {save_path}", flush=True)
     except Exception as e:
-        print(f"Failed to plot asymmetric results: {e}")
+        print(f"Failed to plot sign/verify time: {e}", flush=True)
+
+def plot_key_gen_memory(df, fig, ax):
+    """Plots asymmetric key gen peak memory (if the column exists)."""
+    if 'Key Gen Peak (KiB)' not in df.columns:
+        return
+    print(f"Plotting key gen memory from {ASYMMETRIC_CSV}...", flush=True)
+    try:
+        df, has_cached = _generated_keys(df, 'Key Gen Peak (KiB)')
+        ax.bar(np.arange(len(df)), df['Key Gen Peak (KiB)'].to_numpy(), color=_key_colors(df),
+               tick_label=df['Key'].to_numpy())
+        ax.set_title('Asymmetric Key Gen Peak Memory (Lower is Better)')
+        ax.set_ylabel('Peak Memory (KiB)')
+        ax.set_xlabel('Key Type' + (' (cached keys not shown)' if has_cached else ''))
+        ax.tick_params(axis='x', labelrotation=15)
+        ax.grid(axis='y', alpha=0.3)
+
+        save_path = ASYM_MEMORY_CHART
+        _fast_save(fig, save_path)
+        print(f"  -> Saved chart to: {save_path}", flush=True)
+    except Exception as e:
+        print(f"Failed to plot key gen memory: {e}", flush=True)
+
+# --- Chart Jobs ---
+# Every chart is independent: (loader, plot function, figure size). Charts
+# are drawn onto the Figure/Axes _render() hands them, so a serial run can
+# reuse one Figure for all of them. The Figure is cleared and gets a fresh
+# Axes per chart: ax.clear() keeps tick/grid styling (grid alpha, label
+# rotation), which would leak from one chart into the next.
+CHART_JOBS = {
+    'symmetric': (_load_sym, plot_symmetric_results, (12, 7)),
+    'key_gen_time': (_load_asym, plot_key_gen_time, None),
+    'sign_verify_time': (_load_asym, plot_sign_verify_time, (10, 6)),
+    'key_gen_memory': (_load_asym, plot_key_gen_memory, None),
+}
+AVAILABLE_CPUS = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)
+# With --parallel, charts are drawn in worker processes. Off by default: four
+# small charts are cheap to draw serially, and the pool has not been shown to
+# be faster.
+PARALLEL = '--parallel' in sys.argv
+
+def use_process_pool(num_jobs):
+    """
+    Worker processes can only pay off when they are forked (they inherit the
+    already imported pandas/matplotlib, the Agg backend and the parsed
+    results) and there are several CPUs. With spawn (the macOS default) or
+    forkserver (the Linux default from Python 3.14) every worker re-imports
+    both, which costs far more than drawing the charts serially. When
+    --parallel was asked for but cannot be used, says why.
+    """
+    if not PARALLEL or num_jobs < 2:
+        return False
+    start_method = multiprocessing.get_start_method()
+    if start_method != 'fork':
+        print(f"--parallel needs the 'fork' start method (this Python uses '{start_method}'): "
+              "drawing the charts one at a time")
+        return False
+    if AVAILABLE_CPUS < 2:
+        print(f"--parallel needs several CPUs (found {AVAILABLE_CPUS}): drawing the charts one at a time")
+        return False
+    return True
+
+def _render(name, fig=None):
+    """
+    Loads the chart's results and draws it. Without a Figure (pool workers)
+    the chart gets its own figure, closed afterwards.
+    """
+    load, plot, figsize = CHART_JOBS[name]
+    df = load()
+    if df.empty: # Header-only or 0-byte results file: no Figure, no savefig
+        print(f"No results to plot for '{name}', skipping", flush=True)
+        return
+    own_figure = fig is None
+    if own_figure:
+        fig = plt.figure(layout='constrained')
+    else:
+        fig.clf()
+    ax = fig.add_subplot()
+    fig.set_size_inches(figsize or plt.rcParams['figure.figsize'])
+    plot(df, fig, ax)
+    if own_figure:
+        plt.close(fig) # Close memory to prevent leaks
 
 
 # --- Run Plots ---
-if os.path.exists(SYMMETRIC_CSV):
-    plot_symmetric_results(SYMMETRIC_CSV)
-else:
-    print(f"Skipping symmetric plots, file not found: {SYMMETRIC_CSV}")
+if __name__ == '__main__':
+    print("Starting visualization script...")
+    if not os.path.exists(RESULTS_FOLDER):
+        print(f"Error: 'results' folder not found at {RESULTS_FOLDER}", file=sys.stderr)
+        sys.exit(1)
+
+    jobs = []
+    if os.path.exists(SYMMETRIC_CSV):
+        jobs.append('symmetric')
+    else:
+        print(f"Skipping symmetric plots, file not found: {SYMMETRIC_CSV}")
+
+    if os.path.exists(ASYMMETRIC_CSV):
+        jobs += ['key_gen_time', 'sign_verify_time', 'key_gen_memory']
+    else:
+        print(f"Skipping asymmetric plots, file not found: {ASYMMETRIC_CSV}")
 
-if os.path.exists(ASYMMETRIC_CSV):
-    plot_asymmetric_results(ASYMMETRIC_CSV)
-else:
-    print(f"Skipping asymmetric plots, file not found: {ASYMMETRIC_CSV}")
+    if use_process_pool(len(jobs)):
+        # Parse each results file once here, before forking, so the workers
+        # inherit the cached frames instead of each parsing the CSV again
+        for name in jobs:
+            CHART_JOBS[name][0]()
+        workers = min(len(jobs), AVAILABLE_CPUS, 4)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_render, jobs))
+    else:
+        # Serial: one Figure is reused for every chart so the figure/backend
+        # setup is paid once; each chart is still its own PNG
+        fig = plt.figure(layout='constrained')
+        for name in jobs:
+            _render(name, fig)
+        plt.close(fig)
 
-print("\nVisualization complete.")
\ No newline at end of file
+    print("\nVisualization complete.")